@@ -2,7 +2,7 @@ from unittest import TestCase
 
 from bib_models import DocID
 
-from ..util import get_primary_docid
+from ..util import get_primary_docid, normalize_relaxed
 
 
 class UtilTestcase(TestCase):
@@ -32,3 +32,24 @@ class UtilTestcase(TestCase):
             DocID(**{"id": "id3", "type": "type3", "scope": "scope"}),
         ]
         self.assertIsNone(get_primary_docid(raw_ids))
+
+    def test_normalize_relaxed(self):
+        data = {
+            "version": "draft-1",
+            "edition": "2",
+        }
+        self.assertTrue(normalize_relaxed(data))
+        self.assertEqual(data, {
+            "version": [{"draft": "draft-1"}],
+            "edition": {"content": "2"},
+        })
+
+    def test_normalize_relaxed_reports_no_changes(self):
+        """
+        normalize_relaxed should return False if there was nothing to change
+        """
+        data = {
+            "version": [{"draft": "draft-1"}],
+            "contributor": [{"person": {"contact": [{"email": "a@b.c"}]}}],
+        }
+        self.assertFalse(normalize_relaxed(data))
@@ -1,4 +1,4 @@
-from typing import cast, Optional, List, Tuple, Dict, Any
+from typing import cast, Optional, Iterator, List, Tuple, Dict, Any
 import logging
 
 from pydantic import ValidationError
@@ -72,33 +72,38 @@ def get_primary_docid(raw_ids: List[DocID]) -> Optional[DocID]:
     :rtype: relaton.models.bibdata.DocID or None
     """
 
-    primary_docids: List[DocID] = [
+    primary_docids: Iterator[DocID] = (
         docid for docid in raw_ids
-        if all([
-            docid.primary is True,
-            # As a further sanity check, require id and type, but no scope:
-            docid.id is not None,
-            docid.type is not None,
-            docid.scope is None,
-        ])
-    ]
-
-    deduped = set([frozenset([id.id, id.type]) for id in primary_docids])
-
-    if len(deduped) != 1:
+        if _is_primary_docid(docid)
+    )
+
+    # Remaining primary docids are only checked for being duplicates
+    # of the first one, without collecting them.
+    primary_docid = next(primary_docids, None)
+    if primary_docid is None or any(
+        (docid.id, docid.type) != (primary_docid.id, primary_docid.type)
+        for docid in primary_docids
+    ):
         log.warn(
             "get_primary_docid(): unexpected number of primary docids "
             "found for %s: %s",
             raw_ids,
-            len(primary_docids))
+            len([docid for docid in raw_ids if _is_primary_docid(docid)]))
+
+    return primary_docid
 
-    try:
-        return primary_docids[0]
-    except IndexError:
-        return None
+
+def _is_primary_docid(docid: DocID) -> bool:
+    return (
+        docid.primary is True
+        # As a further sanity check, require id and type, but no scope:
+        and docid.id is not None
+        and docid.type is not None
+        and docid.scope is None
+    )
 
 
-def normalize_relaxed(data: Dict[str, Any]):
+def normalize_relaxed(data: Dict[str, Any]) -> bool:
     """
     Normalizes possibly relaxed/abbreviated deserialized structure,
     where possible, to minimize validation errors.
@@ -109,23 +114,30 @@ def normalize_relaxed(data: Dict[str, Any]):
 
     Is not expected to raise anything.
 
-    :rtype dict:
+    :returns: whether anything was changed, so that callers can avoid
+              validating data again when normalization didn’t help
     """
-    versions = as_list(data.get('version', []))
-    if versions:
+    changed = False
+
+    if raw_versions := data.get('version', []):
         try:
-            data['version'] = [
+            versions = [
                 (normalize_version(item) if isinstance(item, str) else item)
-                for item in versions
+                for item in as_list(raw_versions)
             ]
         except Exception:
             pass
+        else:
+            if versions != raw_versions:
+                data['version'] = versions
+                changed = True
 
     if edition := data.get('edition', None):
         if isinstance(edition, str):
             data['edition'] = {
                 'content': edition
             }
+            changed = True
 
     for contributor in data.get('contributor', []):
         person_or_org = contributor.get(
@@ -133,22 +145,25 @@ def normalize_relaxed(data: Dict[str, Any]):
             contributor.get(
                 'organization',
                 {}))
-        contacts = as_list(person_or_org.get('contact', []))
-        if contacts:
+        if raw_contacts := person_or_org.get('contact', []):
             try:
-                person_or_org['contact'] = [
+                contacts = [
                     normalized
                     for normalized in [
                         normalize_contact(item)
-                        for item in contacts
+                        for item in as_list(raw_contacts)
                         if isinstance(item, dict)
                     ]
                     if normalized is not None
                 ]
             except Exception:
                 pass
+            else:
+                if contacts != raw_contacts:
+                    person_or_org['contact'] = contacts
+                    changed = True
 
-    return data
+    return changed
 
 
 def normalize_version(raw: str) -> Dict[str, Any]:
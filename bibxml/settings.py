@@ -282,6 +282,10 @@ CELERY_TASK_TRACK_STARTED = True
 CELERY_TRACK_STARTED = True
 
 CELERY_WORKER_CONCURRENCY = 1
+CELERY_WORKER_POOL = 'solo'
+"""Tasks run in the worker process itself,
+which (unlike a prefork pool process) can fork indexing workers.
+See :data:`INDEXING_PROCESSES`."""
 CELERY_TASK_RESULT_EXPIRES = 604800
 
 
@@ -406,6 +410,24 @@ seconds as countdown upon completion.
    Even if you use this setting, make sure to monitor task status.
 """
 
+INDEXING_PROCESSES: Optional[int] = int(
+    environ.get(
+        'INDEXING_PROCESSES',
+        '',
+    ).strip() or '0'
+) or None
+"""How many worker processes to use
+when parsing and validating source data during indexing.
+
+If not set, the number of CPUs reported by :func:`os.cpu_count` is used.
+
+Has no effect when indexing runs in a daemonic process,
+such as a task in Celery’s default prefork worker pool
+(the solo pool is used instead, see :data:`CELERY_WORKER_POOL`),
+since those can’t start processes of their own.
+Source data is then parsed in that process itself.
+"""
+
 
 # API access
 # ----------
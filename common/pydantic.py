@@ -50,14 +50,11 @@ def get_loc_with_parents(loc: PydanticLoc) -> List[PydanticLoc]:
 def pretty_print_loc(loc: PydanticLoc) -> str:
     """Given a Pydantic ``loc``, formats it as a string.
     """
-    result = ''
-    for part in loc:
-        if isinstance(part, str):
-            result += f'.{part}'
-        elif isinstance(part, int):
-            if part > 0:
-                result += f'#{part + 1}'
-    return result.removeprefix('.')
+    return ''.join([
+        f'.{part}' if isinstance(part, str) else f'#{part + 1}'
+        for part in loc
+        if isinstance(part, str) or isinstance(part, int) and part > 0
+    ]).removeprefix('.')
 
 
 # Some trickery in Pydantic module breaks this:
@@ -88,6 +85,10 @@ def unpack_dataclasses(v: Any):
     converting all encountered dataclasses to dictionaries.
 
     Works around Pydantic’s issues with mixing dataclasses and models.
+
+    Dataclasses are converted with :func:`dataclasses.asdict`,
+    which already recurses into their fields, lists and dicts,
+    so their output is not walked again.
     """
     if isinstance(v, dict):
         return {
@@ -100,8 +101,7 @@ def unpack_dataclasses(v: Any):
             for i in v
         ]
     elif is_dataclass(v):
-        d = asdict(v)
-        return unpack_dataclasses(d)
+        return asdict(v)
     else:
         return v
 
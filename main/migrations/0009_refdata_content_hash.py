@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-14 10:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0008_refdata_latest_date'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='refdata',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', help_text='Digest of the source file this item was indexed from.', max_length=32),
+        ),
+    ]
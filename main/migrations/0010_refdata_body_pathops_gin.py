@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-14 10:19
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0009_refdata_content_hash'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='refdata',
+            name='body_gin',
+        ),
+        migrations.AddIndex(
+            model_name='refdata',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['body'], name='body_pathops_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-14 10:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0010_refdata_body_pathops_gin'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='refdata',
+            name='body_astext_gin',
+        ),
+    ]
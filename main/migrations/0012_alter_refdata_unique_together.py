@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-14 10:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0011_remove_refdata_body_astext_gin'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='refdata',
+            unique_together={('dataset', 'ref')},
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-14 10:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0012_alter_refdata_unique_together'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='refdata',
+            name='indexed_at',
+            field=models.DateTimeField(blank=True, help_text='When this item was last written by the indexer.', null=True),
+        ),
+    ]
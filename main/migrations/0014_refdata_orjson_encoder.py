@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-14 10:32
+
+import common.orjson
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0013_refdata_indexed_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='refdata',
+            name='body',
+            field=models.JSONField(encoder=common.orjson.OrjsonEncoder),
+        ),
+        migrations.AlterField(
+            model_name='refdata',
+            name='representations',
+            field=models.JSONField(default=dict, encoder=common.orjson.OrjsonEncoder),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-14 10:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0014_refdata_orjson_encoder'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='refdata',
+            name='indexing_error',
+            field=models.TextField(blank=True, default='', help_text='Problems found in source data when this item was indexed.'),
+        ),
+    ]
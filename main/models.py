@@ -1,9 +1,10 @@
 from django.db import models
-from django.db.models.functions import Cast
 from django.db.models.fields.json import KeyTransform
 from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import SearchVector
 
+from common.orjson import OrjsonEncoder
+
 
 class RefData(models.Model):
     """Holds bibliographic item data sourced from a dataset,
@@ -38,7 +39,7 @@ class RefData(models.Model):
     filename extension excluded. See :term:`ref`.
     """
 
-    body = models.JSONField()
+    body = models.JSONField(encoder=OrjsonEncoder)
     """Contains canonical Relaton representation
     of :term:`bibliographic item`.
     Can be used to construct
@@ -54,7 +55,43 @@ class RefData(models.Model):
     instead).
     """
 
-    representations = models.JSONField(default=dict)
+    content_hash = models.CharField(
+        max_length=32,
+        default='',
+        blank=True,
+        help_text="Digest of the source file this item was indexed from.")
+    """BLAKE2b digest (hex) of the source file contents
+    as of the last time this item was indexed.
+
+    Lets the indexer skip files that haven’t changed since then.
+    Empty for items indexed before this field was introduced.
+    """
+
+    indexed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When this item was last written by the indexer.")
+    """When the indexing run that last wrote this item started.
+
+    Source files not modified since then are skipped by the indexer
+    without being read.
+    Empty for items indexed before this field was introduced.
+    """
+
+    indexing_error = models.TextField(
+        default='',
+        blank=True,
+        help_text="Problems found in source data when this item was indexed.")
+    """Validation error description for the source file
+    as of the last time this item was indexed.
+
+    Reported again each time the indexer skips the unchanged file.
+    Empty if data was valid, or was indexed without validation.
+    """
+
+    representations = models.JSONField(
+        default=dict,
+        encoder=OrjsonEncoder)
     """Contains alternative representations of the citation.
     A mapping of ``{ <format_id>: <freeform string> }``,
     where format is e.g. “bibxml”.
@@ -77,18 +114,15 @@ class RefData(models.Model):
 
     class Meta:
         db_table = 'api_ref_data'
-        unique_together = [['ref', 'dataset']]
+        unique_together = [['dataset', 'ref']]
         indexes = [
             # TODO: Identify & remove unused indices
+            # jsonb_path_ops supports the @>, @? and @@ operators
+            # used by queries, and is much smaller than the default opclass.
             GinIndex(
                 fields=['body'],
-                name='body_gin',
-            ),
-            GinIndex(
-                SearchVector(
-                    Cast('body', models.TextField()),
-                    config='english'),
-                name='body_astext_gin',
+                opclasses=['jsonb_path_ops'],
+                name='body_pathops_gin',
             ),
             GinIndex(
                 SearchVector(
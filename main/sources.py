@@ -12,20 +12,37 @@ under ``/data/`` directory under repository root
 
 .. seealso:: :rfp:req:`3`
 """
-from typing import Tuple, List, Dict, Any, cast
-import glob
+from typing import Tuple, List, Dict, Iterable, Iterator, Callable
+from typing import Any, Deque, Optional, cast
+from concurrent.futures import Future, ProcessPoolExecutor
+from collections import deque
+from itertools import islice, repeat, starmap
+import contextlib
+import csv
+import functools
+import hashlib
+import io
+import multiprocessing
+import os
+import re
 from os import path
 import datetime
 
 import yaml
+try:
+    from yaml import CSafeLoader as BaseYamlLoader
+except ImportError:
+    from yaml import SafeLoader as BaseYamlLoader  # type: ignore[assignment]
 from celery.utils.log import get_task_logger
 from relaton.models import dates, BibliographicItem
-from pydantic import ValidationError
+from pydantic import validate_model
 from django.core.exceptions import ImproperlyConfigured
 from django.conf import settings
-from django.db import transaction
+from django.db import connection, transaction
+from django.utils import timezone
 
 from bib_models.util import normalize_relaxed
+from common.orjson import dumps as dump_json
 from common.util import as_list
 from common.pydantic import ValidationErrorDict, pretty_print_loc
 from sources import indexable
@@ -92,9 +109,13 @@ get_github_web_issues = (
 )
 
 
+@functools.lru_cache(maxsize=None)
 def get_source_meta(dataset_id: str) -> IndexedSourceMeta:
     """Should be used on ``dataset_id``
-    that represents an ietf-ribose relaton-data-* repo."""
+    that represents an ietf-ribose relaton-data-* repo.
+
+    Memoized, since source metadata is derived from settings only.
+    """
 
     repo_home, _ = locate_relaton_source_repo(dataset_id)
     repo_name = repo_home.split('/')[-1]
@@ -108,14 +129,25 @@ def get_source_meta(dataset_id: str) -> IndexedSourceMeta:
 
 
 def get_indexed_object_meta(dataset_id: str, ref: str) -> IndexedObject:
-    repo_home, branch = locate_relaton_source_repo(dataset_id)
-    file_url = f'{get_github_web_data_root(repo_home, branch)}/data/{ref}.yaml'
     return IndexedObject(
         name=ref,
-        external_url=file_url,
+        external_url=f'{get_data_url_prefix(dataset_id)}{ref}.yaml',
     )
 
 
+@functools.lru_cache(maxsize=None)
+def get_data_url_prefix(dataset_id: str) -> str:
+    """Returns web URL under which dataset’s source files can be found,
+    with trailing slash.
+
+    Memoized, since it is called for every listed item,
+    but depends on dataset ID only.
+    """
+    repo_home, branch = locate_relaton_source_repo(dataset_id)
+    return f'{get_github_web_data_root(repo_home, branch)}/data/'
+
+
+@functools.lru_cache(maxsize=None)
 def locate_relaton_source_repo(dataset_id: str) -> Tuple[str, str]:
     """
     Given a Relaton dataset ID, returns Git repository information
@@ -127,6 +159,8 @@ def locate_relaton_source_repo(dataset_id: str) -> Tuple[str, str]:
                    ensuring that settings reference correct repositories
                    is considered a responsibility of operations engineers.
 
+    Memoized, since settings don’t change at runtime.
+
     :param dataset_id: dataset ID as string
     :returns: tuple (repo_url, repo_branch)
     """
@@ -154,13 +188,16 @@ def register_relaton_source(source_id: str):
             locate_relaton_source_repo(source_id),
         ],
     )({
-        'indexer': (lambda dirs, refs, on_progress, on_error: index_dataset(
-            source_id,
-            path.join(dirs[0], 'data'),
-            refs,
-            on_progress,
-            on_error,
-        )),
+        'indexer': (
+            lambda dirs, refs, on_progress, on_error, force: index_dataset(
+                source_id,
+                path.join(dirs[0], 'data'),
+                refs,
+                on_progress,
+                on_error,
+                force,
+            )
+        ),
         'reset_index': (lambda: reset_index_for_dataset(source_id)),
         'count_indexed': (
             lambda: RefData.objects.filter(dataset=source_id).count()
@@ -175,25 +212,73 @@ for source_id in settings.RELATON_DATASETS:
 # Indexing implementation
 # =======================
 
+class RelatonYamlLoader(BaseYamlLoader):
+    """Loads Relaton source data.
+
+    Uses libyaml, if PyYAML was built with it.
+    Leaves date-like values as strings, letting Relaton models parse them.
+    """
+
+
+# Done once, on this loader only,
+# keeping PyYAML’s own loaders intact.
+RelatonYamlLoader.yaml_implicit_resolvers = {
+    k: [r for r in v if r[0] != "tag:yaml.org,2002:timestamp"]
+    for k, v in RelatonYamlLoader.yaml_implicit_resolvers.items()
+}
+
+
+INDEXING_PROCESSES: int = getattr(
+    settings,
+    'INDEXING_PROCESSES',
+    None) or os.cpu_count() or 1
+"""How many worker processes parse and validate source files
+during indexing.
+See :data:`bibxml.settings.INDEXING_PROCESSES`."""
+
+INDEXING_CHUNK_SIZE = 64
+"""How many source files are handed to a worker process at once."""
+
+INDEXING_BATCH_SIZE = 2000
+"""How many indexed refs are accumulated in memory
+before they are written to the database in a single bulk upsert."""
+
+
 def index_dataset(ds_id, relaton_path, refs=None,
-                  on_progress=None, on_error=None) -> Tuple[int, int]:
+                  on_progress=None, on_error=None,
+                  force=False) -> Tuple[int, int]:
     """Indexes Relaton data into :class:`~.models.RefData` instances.
 
+    Source files not modified since they were last indexed
+    (as per :attr:`~.models.RefData.indexed_at`) are not read,
+    and files whose contents didn’t change
+    (as per :attr:`~.models.RefData.content_hash`) are not parsed again.
+    Their items are left intact, except for the time of indexing,
+    and validation errors recorded for them
+    (as per :attr:`~.models.RefData.indexing_error`)
+    are reported again via ``on_error``.
+    Pass ``force`` to read, validate and rewrite every file regardless,
+    such as after changing how data is parsed or validated.
+
+    Indexed items are committed in batches of :data:`.INDEXING_BATCH_SIZE`,
+    while deletion of items no longer found in source
+    only happens, in its own transaction, once all items were indexed.
+
     :param ds_id: dataset ID as a string
     :param relaton_path: path to Relaton source files
 
     :param refs: a list of string refs to index, or nothing to index everything
     :param on_progress: progress report lambda taking two ints (total, indexed)
+    :param on_error: error report lambda taking two strings (ref, error),
+                     or nothing to skip validation
+    :param force: whether to reindex files that haven’t changed
 
-    :returns: a tuple of two integers (total, indexed)
+    :returns: a tuple of two integers (total, indexed),
+              where total is the number of source files,
+              or of requested refs if ``refs`` were given
 
     :raise EnvironmentError: passes through any IOError, FileNotFoundError etc.
     """
-    yaml.SafeLoader.yaml_implicit_resolvers = {
-        k: [r for r in v if r[0] != "tag:yaml.org,2002:timestamp"]
-        for k, v in yaml.SafeLoader.yaml_implicit_resolvers.items()
-    }
-
     report_progress = on_progress or (lambda total, current: print(
         "Indexing {}: {} of {}".format(ds_id, total, current))
     )
@@ -201,66 +286,199 @@ def index_dataset(ds_id, relaton_path, refs=None,
     requested_refs = set(refs or [])
     indexed_refs = set()
 
-    relaton_source_files = glob.glob("%s/*.yaml" % relaton_path)
+    # Taken before any file is read, so that a file modified
+    # while this run is in progress is picked up by the next one.
+    started_at = timezone.now()
 
-    total = len(relaton_source_files)
+    # Such as when a checkout has no data directory
+    if not path.isdir(relaton_path):
+        raise RuntimeError("The source is empty")
 
-    if total < 1:
+    if refs is not None:
+        # Only requested files are looked up,
+        # rather than listing the entire source directory.
+        # Refs come from user input, so anything that isn’t a plain
+        # file name (and could point outside source directory)
+        # is treated as not found.
+        source_files: List[Tuple[str, str]] = [
+            (ref, fpath)
+            for ref in requested_refs
+            if path.basename(ref) == ref
+            and path.isfile(fpath := path.join(relaton_path, f'{ref}.yaml'))
+        ]
+        total = len(requested_refs)
+        is_empty = False
+        if not source_files:
+            # Could be a broken checkout, rather than refs being gone.
+            with os.scandir(relaton_path) as it:
+                is_empty = not any(
+                    entry.name.endswith('.yaml')
+                    for entry in it
+                )
+
+    else:
+        # DirEntry.is_file() relies on file type reported
+        # by directory listing, saving a stat() call per file
+        # where the OS supports that.
+        # The name is checked first, since that never needs a syscall.
+        with os.scandir(relaton_path) as it:
+            source_files = [
+                (entry.name[:-len('.yaml')], entry.path)
+                for entry in it
+                if entry.name.endswith('.yaml') and entry.is_file()
+            ]
+        total = len(source_files)
+        is_empty = total < 1
+
+    if is_empty:
         raise RuntimeError("The source is empty")
 
     report_progress(total, 0)
 
+    # What is known about previously indexed items, to avoid reading,
+    # parsing and rewriting those whose source files haven’t changed.
+    indexed_items = RefData.objects.filter(dataset=ds_id)
+    if refs is not None:
+        indexed_items = indexed_items.filter(ref__in=requested_refs)
+    if force:
+        # Every file is then treated as never indexed.
+        indexed_items = indexed_items.none()
+    known_items: Dict[str, Tuple[str, Optional[datetime.datetime], str]] = {
+        ref: (content_hash, indexed_at, indexing_error)
+        for ref, content_hash, indexed_at, indexing_error
+        in indexed_items.values_list(
+            'ref',
+            'content_hash',
+            'indexed_at',
+            'indexing_error',
+        )
+    }
+
+    def report_known_error(ref: str):
+        # Problems with a file that wasn’t parsed this time
+        # are still there, so they are reported like new ones.
+        if on_error and (err_desc := known_items[ref][2]):
+            on_error(ref, err_desc)
+
+    refs_to_index: List[str] = []
+    paths_to_index: List[str] = []
+    known_hashes: List[Optional[str]] = []
+    for ref, fpath in source_files:
+        known_hash, indexed_at, _ = known_items.get(ref, (None, None, ''))
+
+        if indexed_at and os.stat(fpath).st_mtime < indexed_at.timestamp():
+            # Not modified since it was indexed.
+            # Counts as indexed, so that it is not deleted below.
+            indexed_refs.add(ref)
+            report_known_error(ref)
+            continue
+
+        refs_to_index.append(ref)
+        paths_to_index.append(fpath)
+        known_hashes.append(known_hash)
+
+    skipped = total - len(refs_to_index)
+
+    # Progress may be reported over the network (e.g., as task state),
+    # so it is reported about 200 times per run, rather than for each ref.
+    progress_step = max(1, total // 200)
+    last_idx = len(refs_to_index) - 1
+
+    pending: List[RefData] = []
+    touched_refs: List[str] = []
+
+    def flush_pending():
+        # Committed batch by batch, so that a long run doesn’t hold
+        # its locks and row versions until the very end.
+        # An interrupted run is resumed by the next one,
+        # which skips refs already indexed.
+        with transaction.atomic():
+            upsert_refs(pending)
+        pending.clear()
+
+    # Files are parsed and validated in worker processes,
+    # while database writes stay in this process.
+    # Starting workers is only worth it if each gets at least a chunk
+    # of files, which is often not the case when few sources changed.
+    # Daemonic processes, such as those of Celery’s default prefork pool,
+    # are not allowed to have children, so files are parsed in place there.
+    # Workers are forked: unpickling parse_and_validate() imports this module,
+    # which needs Django set up, and spawned processes would not have it.
+    workers = min(
+        INDEXING_PROCESSES,
+        len(paths_to_index) // INDEXING_CHUNK_SIZE)
+    pool = (
+        ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('fork'))
+        if workers > 1 and not multiprocessing.current_process().daemon
+        else None
+    )
+    with pool or contextlib.nullcontext():
+        parse_args = zip(
+            paths_to_index,
+            known_hashes,
+            repeat(on_error is not None),
+            # Same for every dateless item in this run.
+            repeat(datetime.date.today()),
+        )
+        parsed = (
+            starmap_bounded(
+                pool,
+                parse_and_validate,
+                parse_args,
+                # Enough to keep every worker busy
+                max_pending=workers * 4)
+            if pool
+            else starmap(parse_and_validate, parse_args)
+        )
+
+        for idx, (ref, result) in enumerate(zip(refs_to_index, parsed)):
+            if idx % progress_step == 0 or idx == last_idx:
+                report_progress(total, skipped + idx)
+
+            # Unchanged refs count as indexed,
+            # so that they are not deleted below.
+            indexed_refs.add(ref)
+
+            if result is None:
+                touched_refs.append(ref)
+                report_known_error(ref)
+                continue
+
+            ref_data, latest_date, err_desc, content_hash = result
+
+            if err_desc is not None and on_error:
+                on_error(ref, err_desc)
+
+            pending.append(RefData(
+                ref=ref,
+                dataset=ds_id,
+                body=ref_data,
+                latest_date=latest_date,
+                representations=dict(),
+                content_hash=content_hash,
+                indexed_at=started_at,
+                indexing_error=err_desc or '',
+            ))
+            if len(pending) >= INDEXING_BATCH_SIZE:
+                flush_pending()
+
+        if pending:
+            flush_pending()
+
     with transaction.atomic():
-        for idx, relaton_fpath in enumerate(relaton_source_files):
-            ref = path.splitext(path.basename(relaton_fpath))[0]
-
-            if refs is None or ref in requested_refs:
-                report_progress(total, idx)
-
-                with open(relaton_fpath, 'r', encoding='utf-8') \
-                     as relaton_fhandler:
-                    ref_data = yaml.load(
-                        relaton_fhandler.read(),
-                        Loader=yaml.SafeLoader)
-
-                    latest_date = max(
-                        to_dates(as_list(ref_data.get('date', [])))
-                        or [datetime.datetime.now().date()]
-                    )
-
-                    if on_error:
-                        try:
-                            BibliographicItem(**ref_data)
-                        except ValidationError as validation_error:
-                            err_desc = '\n'.join([
-                                f"{d['type']} at "
-                                f"{pretty_print_loc(d['loc'])}: {d['msg']}"
-                                for d in cast(
-                                    List[ValidationErrorDict],
-                                    validation_error.errors()
-                                )
-                            ])
-                            try:
-                                normalize_relaxed(ref_data)
-                                BibliographicItem(**ref_data)
-                            except Exception:
-                                on_error(ref, err_desc)
-                            else:
-                                on_error(
-                                    ref,
-                                    'resolved (normalized):\n%s' % err_desc)
-
-                    RefData.objects.update_or_create(
-                        ref=ref,
-                        dataset=ds_id,
-                        defaults=dict(
-                            body=ref_data,
-                            latest_date=latest_date,
-                            representations=dict(),
-                        ),
-                    )
-
-                    indexed_refs.add(ref)
+        # Files modified but with unchanged contents only get
+        # their indexing time bumped, without rewriting the rest of the row,
+        # so that next time they are not read at all.
+        for batch_start in range(0, len(touched_refs), INDEXING_BATCH_SIZE):
+            (RefData.objects.
+                filter(
+                    dataset=ds_id,
+                    ref__in=touched_refs[
+                        batch_start:batch_start + INDEXING_BATCH_SIZE],
+                ).
+                update(indexed_at=started_at))
 
         if refs is not None:
             # If we’re indexing a subset of refs,
@@ -268,29 +486,258 @@ def index_dataset(ds_id, relaton_path, refs=None,
             # delete those refs from the dataset.
             missing_refs = requested_refs - indexed_refs
             (RefData.objects.
-                filter(dataset=ds_id).
-                exclude(ref__in=missing_refs).
+                filter(dataset=ds_id, ref__in=missing_refs).
                 delete())
 
         else:
             # If we’re reindexing the entire dataset,
             # delete all refs not found in source.
-            (RefData.objects.
-                filter(dataset=ds_id).
-                exclude(ref__in=indexed_refs).
-                delete())
+            delete_refs_not_in(ds_id, indexed_refs)
 
     return total, len(indexed_refs)
 
 
+def starmap_bounded(
+    pool: ProcessPoolExecutor,
+    func: Callable[..., Any],
+    args: Iterable[Tuple[Any, ...]],
+    max_pending: int,
+) -> Iterator[Any]:
+    """Like :func:`itertools.starmap()`,
+    but calls ``func`` in given pool’s worker processes.
+
+    Unlike :meth:`~concurrent.futures.Executor.map()`,
+    which submits everything at once, keeps at most ``max_pending``
+    :data:`.INDEXING_CHUNK_SIZE`-sized chunks submitted
+    and not yet consumed, so that workers don’t get arbitrarily far
+    ahead of the consumer and results don’t pile up in memory.
+
+    Results are yielded in order.
+    """
+    pending: Deque[Future[List[Any]]] = deque()
+    args_iter = iter(args)
+
+    while chunk := list(islice(args_iter, INDEXING_CHUNK_SIZE)):
+        pending.append(pool.submit(_starmap_list, func, chunk))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().result()
+
+    while pending:
+        yield from pending.popleft().result()
+
+
+def _starmap_list(
+    func: Callable[..., Any],
+    args: List[Tuple[Any, ...]],
+) -> List[Any]:
+    return list(starmap(func, args))
+
+
+def upsert_refs(items: List[RefData]):
+    """Creates or updates given references in a single statement.
+
+    Items are copied into a temporary table,
+    skipping per-row parameter binding,
+    and then upserted from it with ``INSERT … ON CONFLICT DO UPDATE``.
+
+    Must be called within a transaction.
+    """
+    buf = io.StringIO()
+    csv.writer(buf).writerows(
+        (
+            item.dataset,
+            item.ref,
+            item.ref_id,
+            item.ref_type,
+            dump_json(item.body),
+            item.latest_date.isoformat(),
+            dump_json(item.representations),
+            item.content_hash,
+            item.indexed_at.isoformat() if item.indexed_at else None,
+            item.indexing_error,
+        )
+        for item in items
+    )
+    buf.seek(0)
+
+    columns = (
+        'dataset, ref, ref_id, ref_type, body, latest_date, '
+        'representations, content_hash, indexed_at, indexing_error'
+    )
+
+    with connection.cursor() as cursor:
+        # Column types are taken from the table itself,
+        # without any of its constraints.
+        cursor.execute(f'''
+            CREATE TEMPORARY TABLE staging_refs
+            ON COMMIT DROP
+            AS SELECT {columns} FROM api_ref_data
+            WITH NO DATA
+        ''')
+        # Unquoted empty CSV values are read as NULL,
+        # which is not what empty strings mean here.
+        cursor.copy_expert(
+            f'COPY staging_refs ({columns}) FROM STDIN WITH ('
+            'FORMAT csv, '
+            'FORCE_NOT_NULL (ref_id, ref_type, content_hash, indexing_error))',
+            buf)
+        cursor.execute(f'''
+            INSERT INTO api_ref_data ({columns})
+            SELECT {columns} FROM staging_refs
+            ON CONFLICT (dataset, ref) DO UPDATE SET
+                body = excluded.body,
+                latest_date = excluded.latest_date,
+                representations = excluded.representations,
+                content_hash = excluded.content_hash,
+                indexed_at = excluded.indexed_at,
+                indexing_error = excluded.indexing_error
+        ''')
+        # Don’t wait for commit, in case the caller’s transaction
+        # goes on to call this again.
+        cursor.execute('DROP TABLE staging_refs')
+
+
+def delete_refs_not_in(ds_id: str, live_refs: Iterable[str]):
+    """Deletes references for given dataset,
+    except for those in ``live_refs``.
+
+    Instead of an ``IN (…)`` clause with every live ref,
+    which gets costly to parse and plan for large datasets,
+    live refs are copied into a temporary table
+    and the delete is an anti-join against it.
+
+    Must be called within a transaction.
+    """
+    buf = io.StringIO()
+    csv.writer(buf).writerows((ref, ) for ref in live_refs)
+    buf.seek(0)
+
+    with connection.cursor() as cursor:
+        cursor.execute('''
+            CREATE TEMPORARY TABLE live_refs (ref text PRIMARY KEY)
+            ON COMMIT DROP
+        ''')
+        cursor.copy_expert(
+            'COPY live_refs (ref) FROM STDIN WITH (FORMAT csv)',
+            buf)
+        cursor.execute('ANALYZE live_refs')
+        cursor.execute('''
+            DELETE FROM api_ref_data
+            WHERE dataset = %s AND NOT EXISTS (
+                SELECT 1 FROM live_refs
+                WHERE live_refs.ref = api_ref_data.ref
+            )
+        ''', [ds_id])
+        # Don’t wait for commit, in case the caller’s transaction
+        # goes on to call this again.
+        cursor.execute('DROP TABLE live_refs')
+
+
+def parse_and_validate(
+    relaton_fpath: str,
+    known_hash: Optional[str],
+    validate: bool,
+    fallback_date: datetime.date,
+) -> Optional[Tuple[Dict[str, Any], datetime.date, Optional[str], str]]:
+    """Loads a single Relaton source file,
+    unless its contents match given digest.
+
+    Called in indexing worker processes (see :data:`.INDEXING_PROCESSES`),
+    so it must not access the database.
+
+    :param relaton_fpath: path to the YAML file
+    :param known_hash: content digest recorded
+                       when the file was last indexed, if any
+    :param validate: whether to validate the data
+                     as a :class:`relaton.models.bibdata.BibliographicItem`
+    :param fallback_date: latest date to use if data has no valid dates
+
+    :returns: ``None`` if file contents match ``known_hash``,
+              otherwise a 4-tuple (deserialized data, latest date,
+              validation error description or None, content digest)
+    """
+    with open(relaton_fpath, 'rb') as relaton_fhandler:
+        raw = relaton_fhandler.read()
+
+    content_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    if content_hash == known_hash:
+        return None
+
+    ref_data = yaml.load(raw, Loader=RelatonYamlLoader)
+
+    latest_date = max(
+        to_dates(as_list(ref_data.get('date', [])))
+        or [fallback_date]
+    )
+
+    err_desc: Optional[str] = None
+
+    if validate:
+        # Only errors are needed, so no model instance is constructed.
+        *_, validation_error = validate_model(BibliographicItem, ref_data)
+        if validation_error is not None:
+            err_desc = '\n'.join(map(
+                format_validation_error,
+                cast(
+                    List[ValidationErrorDict],
+                    validation_error.errors()
+                ),
+            ))
+            # Validating again is only worth it
+            # if normalization changed anything.
+            try:
+                if normalize_relaxed(ref_data):
+                    *_, validation_error = validate_model(
+                        BibliographicItem,
+                        ref_data)
+                    if validation_error is None:
+                        err_desc = 'resolved (normalized):\n%s' % err_desc
+            except Exception:
+                pass
+
+    return ref_data, latest_date, err_desc, content_hash
+
+
+def format_validation_error(err: ValidationErrorDict) -> str:
+    """Formats a single validation error for indexing error reports."""
+    return f"{err['type']} at {pretty_print_loc(err['loc'])}: {err['msg']}"
+
+
+_DATE_RE = re.compile(r'([0-9]{4})(?:-([0-9]{2}))?(?:-([0-9]{2}))?')
+"""Matches the most common date shapes in Relaton data:
+YYYY, YYYY-MM and YYYY-MM-DD."""
+
+_EPOCH = datetime.date(1970, 1, 1)
+
+
 def to_dates(items: List[Dict[str, Any]]) -> List[datetime.date]:
     """Converts a list of dates in raw deserialized Relaton data
-    into a list of ``datetime.date`` objects."""
+    into a list of ``datetime.date`` objects.
+
+    Plain YYYY, YYYY-MM and YYYY-MM-DD values are converted directly,
+    anything else goes through Relaton’s date parsers.
+    """
 
     result: List[datetime.date] = []
     for item in items:
         raw_date = item.get('value', None)
         if raw_date:
+            if isinstance(raw_date, str) and \
+                    (match := _DATE_RE.fullmatch(raw_date)):
+                year, month, day = match.groups()
+                try:
+                    date = datetime.date(
+                        int(year),
+                        int(month or 1),
+                        int(day or 1))
+                except ValueError:
+                    pass
+                else:
+                    # Like Relaton’s parser, don’t trust the epoch
+                    if date != _EPOCH:
+                        result.append(date)
+                        continue
+
             parsed = dates.parse_date_pydantic(raw_date)
             if parsed:
                 result.append(parsed)
@@ -302,7 +749,14 @@ def to_dates(items: List[Dict[str, Any]]) -> List[datetime.date]:
 
 
 def reset_index_for_dataset(ds_id):
-    """Deletes all references for given dataset."""
+    """Deletes all references for given dataset.
+
+    .. note:: This is a single ``DELETE … WHERE dataset = …`` statement,
+              since Django doesn’t need to fetch rows before deleting
+              unless a model has relations or delete signal receivers.
+              Keep it that way for :class:`~.models.RefData`,
+              or switch to raw SQL here.
+    """
 
     with transaction.atomic():
         (RefData.objects.
@@ -0,0 +1,373 @@
+import datetime
+import os
+import tempfile
+from os import path
+from typing import Any, Dict
+from unittest import mock
+
+import yaml
+from django.test import TestCase
+
+from main.models import RefData
+from main.sources import index_dataset, starmap_bounded, to_dates
+
+
+class IndexDatasetTestCase(TestCase):
+    """
+    Test cases for index_dataset() in sources.py
+    """
+
+    def setUp(self):
+        self.dataset_id = "test_dataset"
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.relaton_path = self._tmp_dir.name
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _write_ref(self, ref: str, body: Dict[str, Any]):
+        with open(path.join(self.relaton_path, f'{ref}.yaml'), 'w') as f:
+            yaml.dump(body, f)
+
+    def _make_body(self, ref: str, date: str = "2000-01-01"):
+        return {
+            "id": ref,
+            "docid": [{"id": ref, "type": "standard", "primary": True}],
+            "date": [{"type": "published", "value": date}],
+        }
+
+    def _index(self, refs=None):
+        return index_dataset(
+            self.dataset_id,
+            self.relaton_path,
+            refs,
+            on_progress=lambda total, indexed: None,
+        )
+
+    def test_index_dataset(self):
+        self._write_ref("ref_01", self._make_body("ref_01", "2000-01-02"))
+        self._write_ref("ref_02", self._make_body("ref_02", "2001-05"))
+
+        self.assertEqual(self._index(), (2, 2))
+
+        item = RefData.objects.get(dataset=self.dataset_id, ref="ref_02")
+        self.assertEqual(item.body["id"], "ref_02")
+        self.assertEqual(item.latest_date, datetime.date(2001, 5, 1))
+
+    def test_reindex_dataset_updates_and_deletes_refs(self):
+        self._write_ref("ref_01", self._make_body("ref_01"))
+        self._write_ref("ref_02", self._make_body("ref_02"))
+        self._index()
+
+        self._write_ref("ref_01", self._make_body("ref_01", "2010-01-01"))
+        os.remove(path.join(self.relaton_path, "ref_02.yaml"))
+        self._index()
+
+        self.assertEqual(
+            list(RefData.objects.
+                 filter(dataset=self.dataset_id).
+                 values_list('ref', 'latest_date')),
+            [("ref_01", datetime.date(2010, 1, 1))],
+        )
+
+    def test_reindex_dataset_skips_unchanged_refs(self):
+        self._write_ref("ref_01", self._make_body("ref_01"))
+        self._write_ref("ref_02", self._make_body("ref_02"))
+        self._index()
+
+        # Mark items, to tell whether they were rewritten
+        RefData.objects.filter(dataset=self.dataset_id).update(
+            representations={"marker": True})
+        first_indexed_at = RefData.objects.get(
+            dataset=self.dataset_id,
+            ref="ref_01").indexed_at
+
+        self._write_ref("ref_02", self._make_body("ref_02", "2010-01-01"))
+        # Modified, but with identical contents
+        os.utime(path.join(self.relaton_path, "ref_01.yaml"))
+        self.assertEqual(self._index(), (2, 2))
+
+        self.assertEqual(
+            RefData.objects.get(
+                dataset=self.dataset_id,
+                ref="ref_01").representations,
+            {"marker": True})
+        self.assertGreater(
+            RefData.objects.get(
+                dataset=self.dataset_id,
+                ref="ref_01").indexed_at,
+            first_indexed_at)
+        self.assertEqual(
+            RefData.objects.get(
+                dataset=self.dataset_id,
+                ref="ref_02").representations,
+            {})
+
+    def test_reindex_dataset_forced(self):
+        self._write_ref("ref_01", self._make_body("ref_01"))
+        self._write_ref("ref_02", self._make_body("ref_02"))
+        self._index()
+
+        RefData.objects.filter(dataset=self.dataset_id).update(
+            representations={"marker": True})
+        # Modified, but with identical contents
+        os.utime(path.join(self.relaton_path, "ref_01.yaml"))
+        self.assertEqual(
+            index_dataset(
+                self.dataset_id,
+                self.relaton_path,
+                on_progress=lambda total, indexed: None,
+                force=True,
+            ),
+            (2, 2))
+
+        self.assertEqual(
+            list(RefData.objects.
+                 filter(dataset=self.dataset_id).
+                 values_list('representations', flat=True)),
+            [{}, {}])
+
+    def test_index_subset_of_refs(self):
+        self._write_ref("ref_01", self._make_body("ref_01"))
+        self._write_ref("ref_02", self._make_body("ref_02"))
+        self._index()
+
+        self._write_ref("ref_01", self._make_body("ref_01", "2010-01-01"))
+        self.assertEqual(self._index(["ref_01", "ref_03"]), (2, 1))
+
+        self.assertEqual(
+            RefData.objects.filter(dataset=self.dataset_id).count(),
+            2)
+        self.assertEqual(
+            RefData.objects.get(
+                dataset=self.dataset_id,
+                ref="ref_01").latest_date,
+            datetime.date(2010, 1, 1))
+
+    def test_index_dataset_without_source_directory(self):
+        missing_path = path.join(self.relaton_path, "data")
+        for refs in [None, ["ref_01"]]:
+            with self.assertRaisesMessage(
+                    RuntimeError,
+                    "The source is empty"):
+                index_dataset(
+                    self.dataset_id,
+                    missing_path,
+                    refs,
+                    on_progress=lambda total, indexed: None,
+                )
+
+    def test_index_subset_of_refs_outside_source(self):
+        self._write_ref("ref_01", self._make_body("ref_01"))
+        os.mkdir(path.join(self.relaton_path, "sub"))
+        self._write_ref("sub/ref_02", self._make_body("ref_02"))
+        outside_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(outside_dir.cleanup)
+        with open(path.join(outside_dir.name, "ref_03.yaml"), 'w') as f:
+            yaml.dump(self._make_body("ref_03"), f)
+
+        outside_ref = path.join(
+            path.relpath(outside_dir.name, self.relaton_path),
+            "ref_03")
+        self.assertEqual(
+            self._index(["ref_01", "sub/ref_02", outside_ref]),
+            (3, 1))
+        self.assertEqual(
+            list(RefData.objects.
+                 filter(dataset=self.dataset_id).
+                 values_list('ref', flat=True)),
+            ["ref_01"])
+
+    def test_index_dataset_with_large_integers(self):
+        with open(path.join(self.relaton_path, 'ref_01.yaml'), 'w') as f:
+            f.write(yaml.dump(self._make_body("ref_01")))
+            f.write("extent: 123456789012345678901234\n")
+
+        self.assertEqual(self._index(), (1, 1))
+        self.assertEqual(
+            RefData.objects.get(
+                dataset=self.dataset_id,
+                ref="ref_01").body["extent"],
+            123456789012345678901234)
+
+    def test_index_dataset_reports_invalid_refs(self):
+        self._write_ref("ref_01", self._make_body("ref_01"))
+        # Fixed by normalization
+        self._write_ref("ref_02", {
+            **self._make_body("ref_02"),
+            "edition": "2",
+        })
+        # Not fixable
+        self._write_ref("ref_03", {"id": "ref_03"})
+
+        errors = []
+        self.assertEqual(
+            index_dataset(
+                self.dataset_id,
+                self.relaton_path,
+                on_progress=lambda total, indexed: None,
+                on_error=lambda ref, err: errors.append((ref, err)),
+            ),
+            (3, 3))
+
+        self.assertEqual(sorted(errors), [
+            ("ref_02", (
+                "resolved (normalized):\n"
+                "type_error.dataclass at edition: "
+                "instance of Edition, tuple or dict expected"
+            )),
+            ("ref_03", "value_error.missing at docid: field required"),
+        ])
+        # Invalid items are indexed nonetheless,
+        # normalized if possible
+        self.assertEqual(
+            RefData.objects.get(
+                dataset=self.dataset_id,
+                ref="ref_02").body["edition"],
+            {"content": "2"})
+        self.assertEqual(
+            RefData.objects.filter(dataset=self.dataset_id).count(),
+            3)
+
+    def test_reindex_dataset_reports_invalid_unchanged_refs(self):
+        """
+        index_dataset() should report errors recorded for refs
+        whose source files it skips as unchanged
+        """
+        self._write_ref("ref_01", self._make_body("ref_01"))
+        self._write_ref("ref_02", {"id": "ref_02"})
+        self._write_ref("ref_03", {"id": "ref_03"})
+
+        def index():
+            errors = []
+            index_dataset(
+                self.dataset_id,
+                self.relaton_path,
+                on_progress=lambda total, indexed: None,
+                on_error=lambda ref, err: errors.append((ref, err)),
+            )
+            return sorted(errors)
+
+        self.assertEqual(index(), [
+            ("ref_02", "value_error.missing at docid: field required"),
+            ("ref_03", "value_error.missing at docid: field required"),
+        ])
+
+        # Modified, but with identical contents,
+        # while ref_02 is not modified at all
+        os.utime(path.join(self.relaton_path, "ref_03.yaml"))
+        # Changed, still valid
+        self._write_ref("ref_01", self._make_body("ref_01", "2010-01-01"))
+        self.assertEqual(index(), [
+            ("ref_02", "value_error.missing at docid: field required"),
+            ("ref_03", "value_error.missing at docid: field required"),
+        ])
+
+        # Fixed
+        self._write_ref("ref_02", self._make_body("ref_02"))
+        self.assertEqual(index(), [
+            ("ref_03", "value_error.missing at docid: field required"),
+        ])
+
+    def test_index_dataset_in_daemonic_process(self):
+        """
+        index_dataset() should not start worker processes
+        when running in a daemonic process (such as a Celery task)
+        """
+        for idx in range(4):
+            self._write_ref(f"ref_{idx}", self._make_body(f"ref_{idx}"))
+
+        daemonic = mock.Mock(daemon=True)
+        with mock.patch('main.sources.INDEXING_PROCESSES', 2), \
+             mock.patch('main.sources.INDEXING_CHUNK_SIZE', 1), \
+             mock.patch(
+                 'main.sources.multiprocessing.current_process',
+                 return_value=daemonic), \
+             mock.patch(
+                 'main.sources.ProcessPoolExecutor',
+                 side_effect=AssertionError(
+                     "daemonic processes are not allowed to have children",
+                 )) as pool_cls:
+            self.assertEqual(self._index(), (4, 4))
+
+        pool_cls.assert_not_called()
+        self.assertEqual(
+            RefData.objects.filter(dataset=self.dataset_id).count(),
+            4)
+
+    def test_index_dataset_in_worker_processes(self):
+        """
+        index_dataset() should store the same items
+        whether files are parsed in worker processes or in place
+        """
+        for idx in range(12):
+            self._write_ref(
+                f"ref_{idx:02}",
+                self._make_body(f"ref_{idx:02}", f"20{idx:02}-01-01"))
+        # Has no docid
+        self._write_ref("ref_invalid", {"id": "ref_invalid"})
+
+        def index(processes: int):
+            RefData.objects.filter(dataset=self.dataset_id).delete()
+            errors = []
+            with mock.patch('main.sources.INDEXING_PROCESSES', processes), \
+                 mock.patch('main.sources.INDEXING_CHUNK_SIZE', 1), \
+                 mock.patch(
+                     'main.sources.starmap_bounded',
+                     wraps=starmap_bounded) as pooled:
+                result = index_dataset(
+                    self.dataset_id,
+                    self.relaton_path,
+                    on_progress=lambda total, indexed: None,
+                    on_error=lambda ref, err: errors.append(ref),
+                )
+            items = sorted(
+                RefData.objects.
+                filter(dataset=self.dataset_id).
+                values_list('ref', 'body', 'latest_date', 'content_hash'))
+            return pooled.called, result, errors, items
+
+        used_pool, *pooled_results = index(2)
+        self.assertTrue(used_pool)
+
+        used_pool, *serial_results = index(1)
+        self.assertFalse(used_pool)
+
+        self.assertEqual(pooled_results, serial_results)
+        self.assertEqual(pooled_results[0], (13, 13))
+        self.assertEqual(pooled_results[1], ["ref_invalid"])
+
+
+class ToDatesTestCase(TestCase):
+    """
+    Test cases for to_dates() in sources.py
+    """
+
+    def test_to_dates(self):
+        self.assertEqual(
+            to_dates([
+                {"type": "published", "value": "2000"},
+                {"type": "published", "value": "2001-02"},
+                {"type": "published", "value": "2002-03-04"},
+                {"type": "published", "value": "May 2003"},
+                {"type": "published", "value": "2004-5-6"},
+            ]),
+            [
+                datetime.date(2000, 1, 1),
+                datetime.date(2001, 2, 1),
+                datetime.date(2002, 3, 4),
+                datetime.date(2003, 5, 1),
+                datetime.date(2004, 5, 6),
+            ],
+        )
+
+    def test_to_dates_skips_invalid_dates(self):
+        self.assertEqual(
+            to_dates([
+                {"type": "published", "value": "2000-13"},
+                {"type": "published", "value": "2000-02-30"},
+                {"type": "published", "value": "not a date"},
+                {"type": "published"},
+            ]),
+            [],
+        )
@@ -18,7 +18,9 @@ def run_indexer(request, dataset_name):
     refs_raw = request.POST.get('refs', None)
     refs = refs_raw.split(',') if refs_raw else None
 
-    result = fetch_and_index.delay(dataset_name, refs)
+    force = request.POST.get('force', None) == 'true'
+
+    result = fetch_and_index.delay(dataset_name, refs, force)
     task_id = result.id
 
     if task_id:
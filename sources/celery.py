@@ -26,6 +26,8 @@ app.autodiscover_tasks()
 def start_prometheus_exporter(*args, **kwargs):
     """Starts Prometheus exporter when worker process initializes.
 
+    The solo pool sends this signal too, from the worker process itself.
+
     .. important::
 
        **No accommodations are made for multiprocessing mode.**
@@ -44,6 +46,9 @@ def start_prometheus_exporter(*args, **kwargs):
          with more than one worker.
          It’ll be a problem for other reasons than Prometheus export,
          unless tasks are properly parallelized.
+         The solo pool is used instead (see ``CELERY_WORKER_POOL``),
+         so that indexing can parse source data in worker processes
+         of its own.
        - Once parallelized into smaller I/O bound tasks,
          switch to eventlet/gevent pooling,
          and use the appropriate signal (possibly ``celeryd_init``)
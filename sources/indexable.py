@@ -49,12 +49,13 @@ class IndexableSource:
             Optional[List[str]],
             Optional[Callable[[str, int, int], None]],
             Optional[Callable[[str, str], None]],
+            bool,
         ],
         Tuple[int, int],
     ]
     """
     The indexer function. Takes 3 positional arguments,
-    any of which can be None:
+    any of which can be None, and an optional boolean:
 
     1) a list of source-specific references to index
        (absence means “index all”)
@@ -63,6 +64,8 @@ class IndexableSource:
        and 2 ints, total and indexed).
     3) an on-error handler, called with 2 strings
        (problematic item and error description).
+    4) whether to index even if source data seems unchanged
+       (false by default).
 
     Returns 2-tuple of integers
     (number of found items, number of indexed items).
@@ -100,11 +103,12 @@ class IndexableSourceToRegister(TypedDict, total=True):
             Optional[List[str]],
             Callable[[int, int], None],
             Callable[[str, str], None],
+            bool,
         ],
         Tuple[int, int]
     ]
     """
-    A function that will receive 4 positional arguments:
+    A function that will receive 5 positional arguments:
 
     1) a list of directories pre-filled with repository contents
        (one for each of repository sources specified during registration),
@@ -112,7 +116,8 @@ class IndexableSourceToRegister(TypedDict, total=True):
     3) an on-progress handler that should be called
        with 2 ints (total and indexed) on each indexed item,
     4) an on-error handler that should be called
-       with 2 strings (problematic item name and error description).
+       with 2 strings (problematic item name and error description),
+    5) whether to reindex items even if their data seems unchanged.
 
     It must return a 2-tuple (number of found items, number of indexed items).
 
@@ -149,6 +154,10 @@ def register_git_source(source_id: str, repos: List[Tuple[str, str]]):
     def wrapper(index_info: IndexableSourceToRegister):
         total_repos = len(repos)
 
+        # Reported with every indexed item, but fixed per source
+        index_action = 'indexing using data in {}'.format(
+            ', '.join(repo[0] for repo in repos))
+
         if source_id in registry:
             log.warning(
                 "Attempt to register source with same ID: %s",
@@ -175,6 +184,7 @@ def register_git_source(source_id: str, repos: List[Tuple[str, str]]):
             refs: Optional[List[str]],
             on_progress: Optional[Callable[[str, int, int], None]],
             on_item_error: Optional[Callable[[str, str], None]],
+            force: bool = False,
         ) -> Tuple[int, int]:
             work_dir_paths: List[str] = []
             repo_heads: List[str] = []
@@ -209,21 +219,21 @@ def register_git_source(source_id: str, repos: List[Tuple[str, str]]):
 
             heads_serialized = ', '.join(repo_heads)
 
-            if cache.get(latest_indexed_heads_key) != heads_serialized:
+            if force or (
+                    cache.get(latest_indexed_heads_key) != heads_serialized):
                 log.info(
-                    "Repositories changed for %s, starting index",
+                    "Repositories changed for %s "
+                    "or reindexing forced, starting index",
                     source_id)
-                on_index_progress = (lambda total, indexed: on_progress(
-                    'indexing using data in {}'
-                    .format(', '.join(repo[0] for repo in repos)),
-                    total,
-                    indexed,
-                ))
+                on_index_progress = functools.partial(
+                    on_progress,
+                    index_action)
                 found, indexed = index_info['indexer'](
                     work_dir_paths,
                     refs,
                     on_index_progress,
                     on_item_error,
+                    force,
                 )
 
                 # If next indexing run encounters same heads combo, skip index.
@@ -272,13 +282,20 @@ def get_work_dir_path(source_id: str, repo_url, repo_branch):
     """Returns a unique working directory path based on given parameters,
     under :data:`bibxml.settings.DATASET_TMP_ROOT`."""
 
-    dir = hashlib.sha224(
+    return path.join(
+        _get_dataset_tmp_path(source_id),
+        _get_work_dir_name(repo_url, repo_branch))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_work_dir_name(repo_url: str, repo_branch: str) -> str:
+    # Memoized, since repositories are fixed at source registration.
+    # Changing the hash function would orphan existing working directories.
+    return hashlib.sha224(
         "{}::{}".
         format(repo_url, repo_branch).
         encode('utf-8')).hexdigest()
 
-    return path.join(_get_dataset_tmp_path(source_id), dir)
-
 
 def context_processor(request):
     """Makes ``indexable_sources`` available to templates."""
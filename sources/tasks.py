@@ -24,12 +24,14 @@ AUTO_REINDEX_INTERVAL: Optional[int] = getattr(
     None)
 
 
-def fetch_and_index_task(task, dataset_id: str, refs=None):
+def fetch_and_index_task(task, dataset_id: str, refs=None, force=False):
     """(Re)indexes indexable source with given ID.
 
     :param str dataset_id: source ID used during registration.
     :param refs: a list of items to index,
                  if not provided the entire dataset is indexed
+    :param bool force: whether to reindex even if source data
+                       seems unchanged
 
     :rtype: sources.task_status.IndexingTaskCeleryMeta
     """
@@ -97,7 +99,11 @@ def fetch_and_index_task(task, dataset_id: str, refs=None):
                 push_task(dataset_id, task_id)
 
     try:
-        found, indexed = indexable_source.index(refs, update_status, on_error)
+        found, indexed = indexable_source.index(
+            refs,
+            update_status,
+            on_error,
+            force)
 
     except SystemExit:
         logger.exception(
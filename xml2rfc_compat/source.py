@@ -22,6 +22,7 @@ def index_xml2rfc_source(
     refs: Union[List[str], None],
     on_progress: Callable[[int, int], None],
     on_error: Callable[[str, str], None],
+    force: bool,
 ) -> Tuple[int, int]:
     """
     Indexes data from an xml2rfc web server mirror repository:
@@ -29,6 +30,7 @@ def index_xml2rfc_source(
     (if exists).
 
     Uses :class:`.models.Xml2rfcItem` to store indexed data.
+    Every item is rewritten on each run, so ``force`` has no effect.
 
     .. seealso:: :term:`xml2rfc archive source`
     """